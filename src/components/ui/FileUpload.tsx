@@ -17,6 +17,16 @@ const FileUpload: React.FC<FileUploadProps> = ({ onUploadComplete, onError }) =>
     if (!files || files.length === 0) return;
 
     const file = files[0];
+
+    // Reject unsupported or oversized files before entering the processing state
+    const validation = ocrService.validateFile(file);
+    if (!validation.isValid) {
+      if (onError) {
+        onError(validation.error || 'Invalid file');
+      }
+      return;
+    }
+
     setIsProcessing(true);
     setProgress({ status: 'Initializing...', progress: 0 });
 
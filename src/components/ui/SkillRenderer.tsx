@@ -15,14 +15,14 @@ interface SkillDotProps {
   size?: 'small' | 'medium' | 'large';
 }
 
-const SkillDot: React.FC<SkillDotProps> = ({ level, mode, size = 'medium' }) => {
-  const dotSizes = {
-    small: { width: '8px', height: '8px', gap: '3px' },
-    medium: { width: '12px', height: '12px', gap: '4px' },
-    large: { width: '16px', height: '16px', gap: '6px' }
-  };
+const DOT_SIZES = {
+  small: { width: '8px', height: '8px', gap: '3px' },
+  medium: { width: '12px', height: '12px', gap: '4px' },
+  large: { width: '16px', height: '16px', gap: '6px' }
+} as const;
 
-  const currentSize = dotSizes[size];
+const SkillDot: React.FC<SkillDotProps> = ({ level, mode, size = 'medium' }) => {
+  const currentSize = DOT_SIZES[size];
 
   const renderDots = () => {
     const dots = [];
@@ -65,24 +65,21 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
         // Optimistic update
         setUserProfile(updatedProfile);
 
-        // Trigger automatic gap recalculation if timeline data changed
+        // Trigger automatic gap recalculation if timeline data changed.
+        // Recalculation reports synchronously, so its results are folded into
+        // the same write as the original data instead of a second round-trip.
+        let gapUpdates: Partial<ProfileData> = {};
         if (updatedProfile && (data.experience || data.education)) {
-            setupAutoRecalculation(updatedProfile, async (gapUpdates) => {
+            setupAutoRecalculation(updatedProfile, (updates) => {
+                gapUpdates = updates;
                 // Update local state with gap recalculation results
-                setUserProfile(prev => prev ? { ...prev, ...gapUpdates } : null);
-                
-                // Persist gap updates to database
-                try {
-                    await dataService.updateProfileFields(currentUser.uid, gapUpdates);
-                } catch (error) {
-                    console.error('Error persisting gap updates:', error);
-                }
+                setUserProfile(prev => prev ? { ...prev, ...updates } : null);
             });
         }
 
-        // Persist original data
+        // Persist original data together with any gap updates
         try {
-            await dataService.updateProfileFields(currentUser.uid, data);
+            await dataService.updateProfileFields(currentUser.uid, { ...data, ...gapUpdates });
         } catch (error) {
             console.error('Error updating profile:', error);
             // Revert optimistic update on error
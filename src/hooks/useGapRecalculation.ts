@@ -2,6 +2,85 @@ import { useCallback, useEffect, useRef } from 'react';
 import { ProfileData, TimelineEntry, CareerGap } from '../types';
 import { movementAnalyzer } from '../services/movementAnalyzer';
 
+/**
+ * Checks if timeline data has changed by comparing entries
+ */
+const hasTimelineChanged = (
+  previous: TimelineEntry[],
+  current: TimelineEntry[]
+): boolean => {
+  if (previous.length !== current.length) {
+    return true;
+  }
+
+  // Sort both arrays by start date for consistent comparison
+  const sortedPrevious = [...previous].sort((a, b) => 
+    new Date(a.startDate).getTime() - new Date(b.startDate).getTime()
+  );
+  const sortedCurrent = [...current].sort((a, b) => 
+    new Date(a.startDate).getTime() - new Date(b.startDate).getTime()
+  );
+
+  // Compare each entry for changes
+  return sortedPrevious.some((prevEntry, index) => {
+    const currentEntry = sortedCurrent[index];
+    return (
+      prevEntry.id !== currentEntry.id ||
+      prevEntry.startDate.getTime() !== currentEntry.startDate.getTime() ||
+      (prevEntry.endDate?.getTime() || 0) !== (currentEntry.endDate?.getTime() || 0) ||
+      prevEntry.title !== currentEntry.title ||
+      prevEntry.organization !== currentEntry.organization
+    );
+  });
+};
+
+/**
+ * Merges existing gap data with newly detected gaps
+ * Preserves user modifications (resolved status, notes) while updating gap information
+ */
+const mergeGapData = (
+  existingGaps: CareerGap[],
+  detectedGaps: CareerGap[]
+): CareerGap[] => {
+  const mergedGaps: CareerGap[] = [];
+
+  // Process each detected gap
+  (detectedGaps || []).forEach(detectedGap => {
+    // Find matching existing gap by date range
+    const existingGap = existingGaps.find(existing => 
+      Math.abs(existing.startDate.getTime() - detectedGap.startDate.getTime()) < 24 * 60 * 60 * 1000 && // Within 1 day
+      Math.abs(existing.endDate.getTime() - detectedGap.endDate.getTime()) < 24 * 60 * 60 * 1000
+    );
+
+    if (existingGap) {
+      // Preserve user data while updating calculated fields
+      mergedGaps.push({
+        ...detectedGap,
+        id: existingGap.id, // Keep original ID
+        isResolved: existingGap.isResolved, // Preserve resolution status
+        notes: existingGap.notes, // Preserve user notes
+        createdAt: existingGap.createdAt // Keep original creation date
+      });
+    } else {
+      // New gap - use detected data as-is
+      mergedGaps.push(detectedGap);
+    }
+  });
+
+  // Add any resolved gaps that are no longer detected but should be preserved
+  (existingGaps || []).forEach(existingGap => {
+    if (existingGap.isResolved) {
+      const stillExists = mergedGaps.some(merged => merged.id === existingGap.id);
+      if (!stillExists) {
+        // Keep resolved gaps even if they're no longer detected
+        mergedGaps.push(existingGap);
+      }
+    }
+  });
+
+  return mergedGaps;
+};
+
 /**
  * Custom hook for automatic gap recalculation
  * Provides reactive updates when timeline data changes
@@ -73,85 +152,6 @@ export const useGapRecalculation = () => {
     }
   }, []);
 
-  /**
-   * Checks if timeline data has changed by comparing entries
-   */
-  const hasTimelineChanged = useCallback((
-    previous: TimelineEntry[],
-    current: TimelineEntry[]
-  ): boolean => {
-    if (previous.length !== current.length) {
-      return true;
-    }
-
-    // Sort both arrays by start date for consistent comparison
-    const sortedPrevious = [...previous].sort((a, b) => 
-      new Date(a.startDate).getTime() - new Date(b.startDate).getTime()
-    );
-    const sortedCurrent = [...current].sort((a, b) => 
-      new Date(a.startDate).getTime() - new Date(b.startDate).getTime()
-    );
-
-    // Compare each entry for changes
-    return sortedPrevious.some((prevEntry, index) => {
-      const currentEntry = sortedCurrent[index];
-      return (
-        prevEntry.id !== currentEntry.id ||
-        prevEntry.startDate.getTime() !== currentEntry.startDate.getTime() ||
-        (prevEntry.endDate?.getTime() || 0) !== (currentEntry.endDate?.getTime() || 0) ||
-        prevEntry.title !== currentEntry.title ||
-        prevEntry.organization !== currentEntry.organization
-      );
-    });
-  }, []);
-
-  /**
-   * Merges existing gap data with newly detected gaps
-   * Preserves user modifications (resolved status, notes) while updating gap information
-   */
-  const mergeGapData = useCallback((
-    existingGaps: CareerGap[],
-    detectedGaps: CareerGap[]
-  ): CareerGap[] => {
-    const mergedGaps: CareerGap[] = [];
-
-    // Process each detected gap
-    (detectedGaps || []).forEach(detectedGap => {
-      // Find matching existing gap by date range
-      const existingGap = existingGaps.find(existing => 
-        Math.abs(existing.startDate.getTime() - detectedGap.startDate.getTime()) < 24 * 60 * 60 * 1000 && // Within 1 day
-        Math.abs(existing.endDate.getTime() - detectedGap.endDate.getTime()) < 24 * 60 * 60 * 1000
-      );
-
-      if (existingGap) {
-        // Preserve user data while updating calculated fields
-        mergedGaps.push({
-          ...detectedGap,
-          id: existingGap.id, // Keep original ID
-          isResolved: existingGap.isResolved, // Preserve resolution status
-          notes: existingGap.notes, // Preserve user notes
-          createdAt: existingGap.createdAt // Keep original creation date
-        });
-      } else {
-        // New gap - use detected data as-is
-        mergedGaps.push(detectedGap);
-      }
-    });
-
-    // Add any resolved gaps that are no longer detected but should be preserved
-    (existingGaps || []).forEach(existingGap => {
-      if (existingGap.isResolved) {
-        const stillExists = mergedGaps.some(merged => merged.id === existingGap.id);
-        if (!stillExists) {
-          // Keep resolved gaps even if they're no longer detected
-          mergedGaps.push(existingGap);
-        }
-      }
-    });
-
-    return mergedGaps;
-  }, []);
-
   /**
    * Sets up automatic recalculation when profile data changes
    */
@@ -1,5 +1,8 @@
 import { TimelineEntry, CareerGap, GapSeverity, CAREER_GAP_THRESHOLD_DAYS } from '../types';
 
+// Terms that mark a timeline entry as education rather than employment
+const EDUCATION_KEYWORDS: readonly string[] = ['university', 'college', 'school', 'degree', 'bachelor', 'master', 'phd', 'doctorate'];
+
 /**
  * MovementAnalyzer Service
  * 
@@ -19,20 +22,21 @@ export class MovementAnalyzer {
       return [];
     }
 
-    // Sort timeline entries by start date
-    const sortedTimeline = [...timeline].sort((a, b) => 
-      new Date(a.startDate).getTime() - new Date(b.startDate).getTime()
-    );
+    // Sort timeline entries by start date, resolving each start time once
+    // rather than on both sides of every comparison
+    const sortedTimeline = timeline
+      .map(entry => ({ entry, startTime: new Date(entry.startDate).getTime() }))
+      .sort((a, b) => a.startTime - b.startTime);
 
     const gaps: CareerGap[] = [];
     
     for (let i = 0; i < sortedTimeline.length - 1; i++) {
-      const currentEntry = sortedTimeline[i];
-      const nextEntry = sortedTimeline[i + 1];
+      const currentEntry = sortedTimeline[i].entry;
+      const nextEntry = sortedTimeline[i + 1].entry;
       
       // Use endDate if available, otherwise use startDate of next entry
       const currentEndDate = currentEntry.endDate || new Date();
-      const nextStartDate = new Date(nextEntry.startDate);
+      const nextStartDate = new Date(sortedTimeline[i + 1].startTime);
       
       // Calculate gap in days
       const gapDurationMs = nextStartDate.getTime() - currentEndDate.getTime();
@@ -72,21 +76,25 @@ export class MovementAnalyzer {
    */
   private determineGapType(currentEntry: TimelineEntry, nextEntry: TimelineEntry): 'employment' | 'education' {
     // Simple heuristic: if either entry mentions education-related terms, classify as education gap
-    const educationKeywords = ['university', 'college', 'school', 'degree', 'bachelor', 'master', 'phd', 'doctorate'];
-    
-    const currentIsEducation = educationKeywords.some(keyword => 
-      currentEntry.title.toLowerCase().includes(keyword) || 
-      currentEntry.organization.toLowerCase().includes(keyword)
-    );
-    
-    const nextIsEducation = educationKeywords.some(keyword => 
-      nextEntry.title.toLowerCase().includes(keyword) || 
-      nextEntry.organization.toLowerCase().includes(keyword)
-    );
+    const currentIsEducation = this.isEducationEntry(currentEntry);
+    const nextIsEducation = this.isEducationEntry(nextEntry);
     
     return (currentIsEducation || nextIsEducation) ? 'education' : 'employment';
   }
 
+  /**
+   * Checks whether an entry's title or organization mentions education-related terms
+   */
+  private isEducationEntry(entry: TimelineEntry): boolean {
+    // Lowercase each field once rather than once per keyword
+    const title = entry.title.toLowerCase();
+    const organization = entry.organization.toLowerCase();
+
+    return EDUCATION_KEYWORDS.some(keyword =>
+      title.includes(keyword) || organization.includes(keyword)
+    );
+  }
+
   /**
    * Calculates gap severity based on duration
    */
@@ -3,7 +3,7 @@
  * Handles file upload validation, text extraction, and error handling
  */
 
-import { createWorker, Worker } from 'tesseract.js';
+import type { Worker } from 'tesseract.js';
 import { ParsedResumeData, PersonalInfo, ExperienceEntry, EducationEntry, Skill, Project } from '../types';
 
 export interface OCRResult {
@@ -13,14 +13,138 @@ export interface OCRResult {
   error?: string;
 }
 
+export interface FileValidationResult {
+  readonly isValid: boolean;
+  readonly error?: string;
+}
+
 export interface OCRProgress {
   status: string;
   progress: number;
 }
 
+// Upload constraints
+const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
+const ALLOWED_FILE_TYPES: ReadonlySet<string> = new Set([
+  'image/jpeg',
+  'image/jpg',
+  'image/png',
+  'image/gif',
+  'image/bmp',
+  'image/webp',
+  'application/pdf'
+]);
+
+// OCR processing limits
+const OCR_TIMEOUT_MS = 30000; // 30 second budget shared by all recognition attempts
+const OCR_CACHE_LIMIT = 10; // Recognized files kept for re-uploads of identical content
+const MAX_CANVAS_DIMENSION = 3508; // Long edge of an A4 page at 300 DPI; larger images gain no OCR accuracy
+
+// Tesseract worker parameters applied once after the worker is created
+const OCR_WORKER_PARAMETERS = {
+  tessedit_pageseg_mode: 1 as any, // Automatic page segmentation with OSD
+  tessedit_char_whitelist: 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?@#$%^&*()_+-=[]{}|;:\'\"<>/\\`~ \n\t',
+};
+
+// Shared, immutable validation results; none of them carry per-file data
+const VALID_FILE_RESULT: FileValidationResult = Object.freeze({ isValid: true });
+const FILE_TOO_LARGE_RESULT: FileValidationResult = Object.freeze({
+  isValid: false,
+  error: 'File size exceeds 10MB limit'
+});
+const UNSUPPORTED_FILE_TYPE_RESULT: FileValidationResult = Object.freeze({
+  isValid: false,
+  error: 'Unsupported file type. Please upload an image (JPEG, PNG, GIF, BMP, WebP) or PDF file.'
+});
+
+// Section header patterns, matched case-insensitively anywhere in a line.
+// Multi-word headers ('work experience', 'technical skills', ...) are covered
+// by a shorter keyword in the same pattern.
+const EXPERIENCE_SECTION_REGEX = /experience|work|employment|career|professional/i;
+const EXPERIENCE_SECTION_END_REGEX = /education|skills|projects|certifications/i;
+const EDUCATION_SECTION_REGEX = /education|degree|university|college|school/i;
+const EDUCATION_SECTION_END_REGEX = /experience|skills/i;
+const SKILLS_SECTION_REGEX = /skills|technologies|tools|languages|frameworks|software|platforms/i;
+const SKILLS_SECTION_END_REGEX = /experience|education|projects|certifications/i;
+const PROJECTS_SECTION_REGEX = /projects|portfolio|work samples/i;
+const PROJECTS_SECTION_END_REGEX = /experience|education|skills/i;
+
+// Number of leading lines searched for contact details and the candidate name
+const PERSONAL_INFO_LINE_LIMIT = 15;
+
+// Contact detail patterns for the resume header
+const EMAIL_REGEX = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/;
+const PHONE_REGEX = /(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})/;
+const LINKEDIN_REGEX = /(linkedin\.com\/in\/[A-Za-z0-9-]+|linkedin\.com\/pub\/[A-Za-z0-9-]+)/i;
+const WEBSITE_REGEX = /(https?:\/\/[^\s]+|www\.[^\s]+)/i;
+const LOCATION_REGEX = /^(.+),\s*([A-Z]{2}|[A-Za-z\s]+)$/; // City, State format
+
+// Job entry patterns, tried in order (first match wins). Their lazy groups
+// backtrack polynomially on non-matching input, so they are only run on lines
+// up to MAX_ENTRY_LINE_LENGTH characters; real title lines are far shorter.
+const MAX_ENTRY_LINE_LENGTH = 200;
+const EXPERIENCE_ENTRY_PATTERNS: readonly RegExp[] = [
+  /^(.+?)\s+(?:at|@)\s+(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i, // Title at Company | Location | Dates
+  /^(.+?)\s*[-–—]\s*(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i,    // Title - Company | Location | Dates
+  /^(.+?),\s*(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i,           // Title, Company | Location | Dates
+];
+
+// Date range patterns, matched against lowercased text
+const YEAR_RANGE_REGEX = /(\d{4})\s*[-–—]\s*(\d{4})/;
+const YEAR_TO_PRESENT_REGEX = /(\d{4})\s*[-–—]\s*(present|current|ongoing)/;
+const SINGLE_YEAR_REGEX = /^(\d{4})$/;
+
+// Degree entry pattern: Degree at/from/, Institution | Location
+const DEGREE_ENTRY_REGEX = /^(.+?)\s+(?:at|from|,)\s+(.+?)(?:\s+\|\s+(.+?))?$/i;
+
+// Skill list parsing patterns
+const SKILL_DELIMITER_REGEX = /[,;|•·\n\t]/;
+const NUMBER_ONLY_REGEX = /^\d+$/;
+// Parenthetical content and level words, stripped from skill names in one pass
+const SKILL_NAME_NOISE_REGEX = /\s*\(.*?\)\s*|\s*(?:expert|advanced|proficient|experienced|intermediate|basic|beginner|familiar)\s*/gi;
+
+// Skill categorization patterns, checked in order (first match wins)
+const SKILL_CATEGORY_KEYWORDS: ReadonlyArray<readonly [string, readonly string[]]> = [
+  ['technical', [
+    'javascript', 'python', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
+    'html', 'css', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'linux'
+  ]],
+  ['framework', [
+    'react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt.js', 'gatsby',
+    'express', 'fastapi', 'django', 'flask', 'spring', 'laravel', 'rails'
+  ]],
+  ['tool', [
+    'git', 'docker', 'kubernetes', 'jenkins', 'webpack', 'babel', 'eslint',
+    'jira', 'confluence', 'slack', 'figma', 'sketch', 'photoshop'
+  ]],
+  ['language', [
+    'english', 'spanish', 'french', 'german', 'chinese', 'japanese', 'korean'
+  ]]
+];
+
+// Skill level indicators, checked from strongest to weakest (first match wins)
+const SKILL_LEVEL_INDICATORS: ReadonlyArray<readonly [number, readonly string[]]> = [
+  [5, ['expert', 'advanced']],
+  [4, ['proficient', 'experienced']],
+  [3, ['intermediate']],
+  [2, ['basic', 'beginner']],
+  [1, ['familiar']]
+];
+
 export class OCRService {
   private worker: Worker | null = null;
   private isInitialized = false;
+  // Pending worker creation, shared by concurrent initialize() calls
+  private initPromise: Promise<void> | null = null;
+  // Successful results keyed by file size and SHA-256 digest, oldest first
+  private resultCache = new Map<string, { size: number; result: OCRResult }>();
+  // Number of cached results per file size, used to skip hashing guaranteed misses
+  private cachedSizeCounts = new Map<number, number>();
+  // Random base and running counter for the IDs of one extraction's entries
+  private idBase = '';
+  private idCounter = 0;
 
   /**
    * Initialize the Tesseract worker
@@ -28,21 +152,37 @@ export class OCRService {
   async initialize(): Promise<void> {
     if (this.isInitialized) return;
 
+    if (!this.initPromise) {
+      this.initPromise = this.startWorker().catch(error => {
+        // Allow a later call to retry after a failed start
+        this.initPromise = null;
+        throw error;
+      });
+    }
+
+    return this.initPromise;
+  }
+
+  /**
+   * Create and configure the Tesseract worker
+   */
+  private async startWorker(): Promise<void> {
     try {
+      // Load tesseract.js on first use so validation and text mapping don't pull
+      // the OCR engine into the initial bundle
+      const { createWorker } = await import('tesseract.js');
       this.worker = await createWorker('eng', 1, {
         logger: m => {
-          // Only log errors and important status updates
-          if (m.status === 'recognizing text' || m.status.includes('error')) {
+          // Only log errors, plus per-tick recognition progress in development
+          if (m.status.includes('error') ||
+            (process.env.NODE_ENV === 'development' && m.status === 'recognizing text')) {
             console.log('OCR:', m);
           }
         }
       });
       
       // Configure the worker for better performance
-      await this.worker.setParameters({
-        tessedit_pageseg_mode: 1 as any, // Automatic page segmentation with OSD
-        tessedit_char_whitelist: 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?@#$%^&*()_+-=[]{}|;:\'\"<>/\\`~ \n\t',
-      });
+      await this.worker.setParameters(OCR_WORKER_PARAMETERS);
       
       this.isInitialized = true;
     } catch (error) {
@@ -53,32 +193,18 @@ export class OCRService {
   /**
    * Validate uploaded file before processing
    */
-  validateFile(file: File): { isValid: boolean; error?: string } {
+  validateFile(file: File): FileValidationResult {
     // Check file size (max 10MB)
-    const maxSize = 10 * 1024 * 1024;
-    if (file.size > maxSize) {
-      return { isValid: false, error: 'File size exceeds 10MB limit' };
+    if (file.size > MAX_FILE_SIZE) {
+      return FILE_TOO_LARGE_RESULT;
     }
 
     // Check file type
-    const allowedTypes = [
-      'image/jpeg',
-      'image/jpg',
-      'image/png',
-      'image/gif',
-      'image/bmp',
-      'image/webp',
-      'application/pdf'
-    ];
-
-    if (!allowedTypes.includes(file.type)) {
-      return {
-        isValid: false,
-        error: 'Unsupported file type. Please upload an image (JPEG, PNG, GIF, BMP, WebP) or PDF file.'
-      };
+    if (!ALLOWED_FILE_TYPES.has(file.type)) {
+      return UNSUPPORTED_FILE_TYPE_RESULT;
     }
 
-    return { isValid: true };
+    return VALID_FILE_RESULT;
   }
 
   /**
@@ -94,6 +220,21 @@ export class OCRService {
       return { success: false, error: validation.error };
     }
 
+    // Reuse the result for content that has already been recognized. Files whose
+    // size matches no cached entry cannot hit, so hashing is deferred until a
+    // successful result needs storing.
+    const cacheKey = this.cachedSizeCounts.has(file.size) ? await this.getCacheKey(file) : null;
+    const cached = cacheKey ? this.resultCache.get(cacheKey) : undefined;
+    if (cacheKey && cached) {
+      // Move the entry to the most recently used position
+      this.resultCache.delete(cacheKey);
+      this.resultCache.set(cacheKey, cached);
+      if (onProgress) {
+        onProgress({ status: 'Text extraction complete', progress: 100 });
+      }
+      return { ...cached.result };
+    }
+
     // Initialize worker if needed
     if (!this.isInitialized) {
       try {
@@ -116,60 +257,86 @@ export class OCRService {
         onProgress({ status: 'Processing file...', progress: 0 });
       }
 
-      // Try multiple approaches to handle the file with timeout
-      let result;
-      const timeout = 30000; // 30 second timeout
-      
-      const recognizeWithTimeout = async (input: any): Promise<any> => {
-        return Promise.race([
-          this.worker!.recognize(input),
-          new Promise((_, reject) => 
-            setTimeout(() => reject(new Error('OCR processing timeout')), timeout)
-          )
-        ]);
-      };
-      
-      try {
-        // First try: Use the file directly
-        result = await recognizeWithTimeout(file);
-      } catch (firstError) {
-        console.warn('Direct file recognition failed, trying blob URL:', firstError);
-        
-        try {
+      // Try multiple approaches to handle the file, all within one timeout budget
+      const worker = this.worker;
+      const deadline = performance.now() + OCR_TIMEOUT_MS;
+
+      // Recognition strategies, tried in order until one succeeds
+      const strategies: Array<{ name: string; run: () => Promise<any> }> = [
+        {
+          // First try: Use the file directly
+          name: 'Direct file',
+          run: () => this.recognizeWithTimeout(worker, file, deadline)
+        },
+        {
           // Second try: Create a blob URL
-          const fileUrl = URL.createObjectURL(file);
-          
-          try {
-            result = await recognizeWithTimeout(fileUrl);
-            URL.revokeObjectURL(fileUrl);
-          } catch (blobError) {
-            URL.revokeObjectURL(fileUrl);
-            throw blobError;
+          name: 'Blob URL',
+          run: async () => {
+            const fileUrl = URL.createObjectURL(file);
+            try {
+              return await this.recognizeWithTimeout(worker, fileUrl, deadline);
+            } finally {
+              URL.revokeObjectURL(fileUrl);
+            }
           }
-        } catch (secondError) {
-          console.warn('Blob URL recognition failed, trying canvas conversion:', secondError);
-          
-          // Third try: Convert to canvas and then to data URL
-          try {
+        }
+      ];
+
+      // Third try: Convert to canvas and recognize its pixels directly.
+      // Image elements cannot decode PDFs, so this would always fail for them.
+      if (file.type !== 'application/pdf') {
+        strategies.push({
+          name: 'Canvas conversion',
+          run: async () => {
             const canvas = await this.fileToCanvas(file);
-            const dataUrl = canvas.toDataURL('image/png');
-            result = await recognizeWithTimeout(dataUrl);
-          } catch (canvasError) {
-            throw new Error(`All OCR methods failed. Last error: ${canvasError instanceof Error ? canvasError.message : 'Unknown error'}`);
+            return this.recognizeWithTimeout(worker, canvas, deadline);
           }
+        });
+      }
+
+      let result;
+      let lastError: unknown;
+      for (const strategy of strategies) {
+        // Stop once the budget is spent rather than queueing more work on the worker
+        if (performance.now() >= deadline) {
+          lastError = new Error('OCR processing timeout');
+          break;
         }
+
+        try {
+          result = await strategy.run();
+          break;
+        } catch (error) {
+          lastError = error;
+          // The last error is reported to the caller; intermediate failures
+          // are only interesting while developing
+          if (process.env.NODE_ENV === 'development') {
+            console.warn(`${strategy.name} recognition failed:`, error);
+          }
+        }
+      }
+
+      if (!result) {
+        throw new Error(`All OCR methods failed. Last error: ${lastError instanceof Error ? lastError.message : 'Unknown error'}`);
       }
 
       if (onProgress) {
         onProgress({ status: 'Text extraction complete', progress: 100 });
       }
 
-      return {
+      const ocrResult: OCRResult = {
         success: true,
         text: result.data.text,
         confidence: result.data.confidence
       };
 
+      const storeKey = cacheKey ?? await this.getCacheKey(file);
+      if (storeKey) {
+        this.cacheResult(storeKey, file.size, ocrResult);
+      }
+
+      return ocrResult;
+
     } catch (error) {
       return {
         success: false,
@@ -178,6 +345,82 @@ export class OCRService {
     }
   }
 
+  /**
+   * Build the result cache key for a file from its size and SHA-256 digest.
+   * Returns null when hashing is unavailable, in which case caching is skipped.
+   */
+  private async getCacheKey(file: File): Promise<string | null> {
+    if (typeof crypto === 'undefined' || !crypto.subtle || typeof file.arrayBuffer !== 'function') {
+      return null;
+    }
+
+    try {
+      const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', await file.arrayBuffer()));
+      let hex = '';
+      for (let i = 0; i < digest.length; i++) {
+        hex += digest[i].toString(16).padStart(2, '0');
+      }
+      return `${file.size}:${hex}`;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Store a successful result, evicting the least recently used entry when full
+   */
+  private cacheResult(key: string, size: number, result: OCRResult): void {
+    this.evictCachedResult(key);
+    this.resultCache.set(key, { size, result: { ...result } });
+    this.cachedSizeCounts.set(size, (this.cachedSizeCounts.get(size) || 0) + 1);
+
+    if (this.resultCache.size > OCR_CACHE_LIMIT) {
+      const oldestKey = this.resultCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.evictCachedResult(oldestKey);
+      }
+    }
+  }
+
+  /**
+   * Remove a cached result and release its file size count
+   */
+  private evictCachedResult(key: string): void {
+    const entry = this.resultCache.get(key);
+    if (!entry) return;
+
+    this.resultCache.delete(key);
+    const remaining = (this.cachedSizeCounts.get(entry.size) || 0) - 1;
+    if (remaining > 0) {
+      this.cachedSizeCounts.set(entry.size, remaining);
+    } else {
+      this.cachedSizeCounts.delete(entry.size);
+    }
+  }
+
+  /**
+   * Run recognition on the worker, rejecting if it has not finished by the deadline
+   * (a performance.now() timestamp)
+   */
+  private recognizeWithTimeout(worker: Worker, input: any, deadline: number): Promise<any> {
+    const remaining = deadline - performance.now();
+    if (remaining <= 0) {
+      // Never queue a recognition the caller has already stopped waiting for
+      return Promise.reject(new Error('OCR processing timeout'));
+    }
+
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    const timeout = new Promise((_, reject) => {
+      timer = setTimeout(
+        () => reject(new Error('OCR processing timeout')),
+        remaining
+      );
+    });
+
+    return Promise.race([worker.recognize(input), timeout])
+      .finally(() => clearTimeout(timer));
+  }
+
   /**
    * Convert file to canvas for OCR processing
    * This is a fallback method when direct file processing fails
@@ -197,12 +440,13 @@ export class OCRService {
         // Clean up the object URL
         URL.revokeObjectURL(img.src);
         
-        // Set canvas dimensions to match image
-        canvas.width = img.naturalWidth;
-        canvas.height = img.naturalHeight;
+        // Match the image dimensions, scaled down so the long edge fits the cap
+        const scale = Math.min(1, MAX_CANVAS_DIMENSION / Math.max(img.naturalWidth, img.naturalHeight));
+        canvas.width = Math.round(img.naturalWidth * scale);
+        canvas.height = Math.round(img.naturalHeight * scale);
 
         // Draw image to canvas
-        ctx.drawImage(img, 0, 0);
+        ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
         
         resolve(canvas);
       };
@@ -229,6 +473,9 @@ export class OCRService {
 
     const lines = text.split('\n').map(line => line.trim()).filter(line => line.length > 0);
 
+    this.idBase = `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+    this.idCounter = 0;
+
     const result: ParsedResumeData = {
       personalInfo: {},
       experience: [],
@@ -260,6 +507,13 @@ export class OCRService {
     return result;
   }
 
+  /**
+   * Generate a unique entry ID from the current extraction's base
+   */
+  private nextId(prefix: string): string {
+    return `${prefix}-${this.idBase}-${this.idCounter++}`;
+  }
+
   /**
    * Get empty parsed data structure
    */
@@ -280,45 +534,39 @@ export class OCRService {
   private extractPersonalInfo(lines: string[]): Partial<PersonalInfo> {
     const personalInfo: Partial<PersonalInfo> = {};
 
-    // Enhanced patterns for better extraction
-    const emailRegex = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/;
-    const phoneRegex = /(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})/;
-    const linkedInRegex = /(linkedin\.com\/in\/[A-Za-z0-9-]+|linkedin\.com\/pub\/[A-Za-z0-9-]+)/i;
-    const websiteRegex = /(https?:\/\/[^\s]+|www\.[^\s]+)/i;
-    const locationRegex = /^(.+),\s*([A-Z]{2}|[A-Za-z\s]+)$/; // City, State format
-
-    // Look through first 15 lines for personal info
-    for (let i = 0; i < Math.min(lines.length, 15); i++) {
+    // Look through the first few lines for personal info
+    const headerLineCount = Math.min(lines.length, PERSONAL_INFO_LINE_LIMIT);
+    for (let i = 0; i < headerLineCount; i++) {
       const line = lines[i];
 
       try {
         // Extract email
-        const emailMatch = line.match(emailRegex);
+        const emailMatch = line.match(EMAIL_REGEX);
         if (emailMatch && !personalInfo.email) {
           personalInfo.email = emailMatch[0].toLowerCase();
         }
 
         // Extract phone
-        const phoneMatch = line.match(phoneRegex);
+        const phoneMatch = line.match(PHONE_REGEX);
         if (phoneMatch && !personalInfo.phone) {
           personalInfo.phone = phoneMatch[0];
         }
 
         // Extract LinkedIn
-        const linkedInMatch = line.match(linkedInRegex);
+        const linkedInMatch = line.match(LINKEDIN_REGEX);
         if (linkedInMatch && !personalInfo.linkedIn) {
           const url = linkedInMatch[0];
           personalInfo.linkedIn = url.startsWith('http') ? url : `https://${url}`;
         }
 
         // Extract portfolio/website (but not LinkedIn)
-        const websiteMatch = line.match(websiteRegex);
+        const websiteMatch = line.match(WEBSITE_REGEX);
         if (websiteMatch && !personalInfo.portfolio && !linkedInMatch) {
           personalInfo.portfolio = websiteMatch[0];
         }
 
         // Extract location (city, state format)
-        const locationMatch = line.match(locationRegex);
+        const locationMatch = line.match(LOCATION_REGEX);
         if (locationMatch && !personalInfo.location && !emailMatch && !phoneMatch) {
           personalInfo.location = line;
         }
@@ -357,28 +605,22 @@ export class OCRService {
    */
   private extractExperience(lines: string[]): Partial<ExperienceEntry>[] {
     const experience: Partial<ExperienceEntry>[] = [];
-    const experienceKeywords = [
-      'experience', 'work', 'employment', 'career', 'professional',
-      'work history', 'professional experience', 'work experience'
-    ];
 
     let inExperienceSection = false;
     let currentEntry: Partial<ExperienceEntry> | null = null;
-    let sectionEndKeywords = ['education', 'skills', 'projects', 'certifications'];
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
-      const lowerLine = line.toLowerCase();
 
       try {
         // Check if we're entering experience section
-        if (!inExperienceSection && experienceKeywords.some(keyword => lowerLine.includes(keyword))) {
+        if (!inExperienceSection && EXPERIENCE_SECTION_REGEX.test(line)) {
           inExperienceSection = true;
           continue;
         }
 
         // Check if we're leaving experience section
-        if (inExperienceSection && sectionEndKeywords.some(keyword => lowerLine.includes(keyword))) {
+        if (inExperienceSection && EXPERIENCE_SECTION_END_REGEX.test(line)) {
           if (currentEntry) {
             experience.push(currentEntry);
             currentEntry = null;
@@ -387,14 +629,8 @@ export class OCRService {
         }
 
         if (inExperienceSection && line.length > 3) {
-          // Enhanced patterns for job entries
-          const patterns = [
-            /^(.+?)\s+(?:at|@)\s+(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i, // Title at Company | Location | Dates
-            /^(.+?)\s*[-–—]\s*(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i,    // Title - Company | Location | Dates
-            /^(.+?),\s*(.+?)(?:\s*\|\s*(.+?))?(?:\s*\|\s*(.+?))?$/i,           // Title, Company | Location | Dates
-          ];
-
           let matched = false;
+          const patterns = line.length <= MAX_ENTRY_LINE_LENGTH ? EXPERIENCE_ENTRY_PATTERNS : [];
           for (const pattern of patterns) {
             const match = line.match(pattern);
             if (match) {
@@ -404,7 +640,7 @@ export class OCRService {
               }
 
               currentEntry = {
-                id: `exp-${Date.now()}-${Math.random()}`,
+                id: this.nextId('exp'),
                 title: match[1]?.trim() || 'Unknown Position',
                 organization: match[2]?.trim() || 'Unknown Company',
                 location: match[3]?.trim(),
@@ -481,7 +717,7 @@ export class OCRService {
       }
 
       // Simple year range pattern (e.g., "2020-2023", "2020 - 2023")
-      const yearRangeMatch = cleanText.match(/(\d{4})\s*[-–—]\s*(\d{4})/);
+      const yearRangeMatch = cleanText.match(YEAR_RANGE_REGEX);
       if (yearRangeMatch) {
         result.startDate = new Date(parseInt(yearRangeMatch[1]), 0, 1);
         result.endDate = new Date(parseInt(yearRangeMatch[2]), 11, 31);
@@ -489,7 +725,7 @@ export class OCRService {
       }
 
       // Year to present pattern (e.g., "2020 - Present")
-      const yearToPresentMatch = cleanText.match(/(\d{4})\s*[-–—]\s*(present|current|ongoing)/);
+      const yearToPresentMatch = cleanText.match(YEAR_TO_PRESENT_REGEX);
       if (yearToPresentMatch) {
         result.startDate = new Date(parseInt(yearToPresentMatch[1]), 0, 1);
         result.endDate = null;
@@ -497,7 +733,7 @@ export class OCRService {
       }
 
       // Single year (assume full year)
-      const singleYearMatch = cleanText.match(/^(\d{4})$/);
+      const singleYearMatch = cleanText.match(SINGLE_YEAR_REGEX);
       if (singleYearMatch) {
         result.startDate = new Date(parseInt(singleYearMatch[1]), 0, 1);
         result.endDate = new Date(parseInt(singleYearMatch[1]), 11, 31);
@@ -516,30 +752,26 @@ export class OCRService {
    */
   private extractEducation(lines: string[]): Partial<EducationEntry>[] {
     const education: Partial<EducationEntry>[] = [];
-    const educationKeywords = ['education', 'degree', 'university', 'college', 'school'];
 
     let inEducationSection = false;
 
     for (const line of lines) {
-      const lowerLine = line.toLowerCase();
-
-      if (educationKeywords.some(keyword => lowerLine.includes(keyword))) {
+      if (EDUCATION_SECTION_REGEX.test(line)) {
         inEducationSection = true;
         continue;
       }
 
-      if (inEducationSection && (lowerLine.includes('experience') || lowerLine.includes('skills'))) {
+      if (inEducationSection && EDUCATION_SECTION_END_REGEX.test(line)) {
         break;
       }
 
       if (inEducationSection && line.length > 5) {
         // Try to parse degree and institution
-        const degreePattern = /^(.+?)\s+(?:at|from|,)\s+(.+?)(?:\s+\|\s+(.+?))?$/i;
-        const match = line.match(degreePattern);
+        const match = line.match(DEGREE_ENTRY_REGEX);
 
         if (match) {
           education.push({
-            id: `edu-${Date.now()}-${Math.random()}`,
+            id: this.nextId('edu'),
             degree: match[1].trim(),
             organization: match[2].trim(),
             title: match[1].trim(),
@@ -560,107 +792,71 @@ export class OCRService {
    */
   private extractSkills(lines: string[]): Partial<Skill>[] {
     const skills: Partial<Skill>[] = [];
-    const skillKeywords = [
-      'skills', 'technologies', 'tools', 'languages', 'frameworks',
-      'technical skills', 'programming languages', 'software', 'platforms'
-    ];
 
     let inSkillsSection = false;
-    const sectionEndKeywords = ['experience', 'education', 'projects', 'certifications'];
-
-    // Skill categorization patterns
-    const skillCategories = {
-      'technical': [
-        'javascript', 'python', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
-        'html', 'css', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql',
-        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'linux'
-      ],
-      'framework': [
-        'react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt.js', 'gatsby',
-        'express', 'fastapi', 'django', 'flask', 'spring', 'laravel', 'rails'
-      ],
-      'tool': [
-        'git', 'docker', 'kubernetes', 'jenkins', 'webpack', 'babel', 'eslint',
-        'jira', 'confluence', 'slack', 'figma', 'sketch', 'photoshop'
-      ],
-      'language': [
-        'english', 'spanish', 'french', 'german', 'chinese', 'japanese', 'korean'
-      ]
-    };
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
-      const lowerLine = line.toLowerCase();
 
       try {
         // Check if we're entering skills section
-        if (!inSkillsSection && skillKeywords.some(keyword => lowerLine.includes(keyword))) {
+        if (!inSkillsSection && SKILLS_SECTION_REGEX.test(line)) {
           inSkillsSection = true;
           continue;
         }
 
         // Check if we're leaving skills section
-        if (inSkillsSection && sectionEndKeywords.some(keyword => lowerLine.includes(keyword))) {
+        if (inSkillsSection && SKILLS_SECTION_END_REGEX.test(line)) {
           break;
         }
 
         if (inSkillsSection && line.length > 2) {
           // Split by common delimiters and clean up
-          const delimiters = /[,;|•·\n\t]/;
-          const skillNames = line.split(delimiters)
-            .map(s => s.trim())
-            .filter(s => s.length > 1 && s.length < 50)
-            .filter(s => !s.toLowerCase().includes('skills')) // Remove section headers
-            .filter(s => !/^\d+$/.test(s)); // Remove standalone numbers
-
-          skillNames.forEach(skillName => {
-            if (skillName.length > 1) {
-              // Determine skill category
-              const lowerSkill = skillName.toLowerCase();
-              let category = 'technical'; // default
-
-              for (const [cat, keywords] of Object.entries(skillCategories)) {
-                if (keywords.some(keyword => lowerSkill.includes(keyword))) {
-                  category = cat;
-                  break;
-                }
-              }
+          for (const rawName of line.split(SKILL_DELIMITER_REGEX)) {
+            const skillName = rawName.trim();
+            const lowerSkill = skillName.toLowerCase();
+
+            // Skip fragments, section headers and standalone numbers
+            if (skillName.length <= 1 || skillName.length >= 50 ||
+              lowerSkill.includes('skills') || NUMBER_ONLY_REGEX.test(skillName)) {
+              continue;
+            }
+
+            // Determine skill category
+            let category = 'technical'; // default
 
-              // Determine skill level based on context clues
-              let level = 3; // default intermediate level
-
-              // Look for level indicators in the skill name or surrounding context
-              if (lowerSkill.includes('expert') || lowerSkill.includes('advanced')) {
-                level = 5;
-              } else if (lowerSkill.includes('proficient') || lowerSkill.includes('experienced')) {
-                level = 4;
-              } else if (lowerSkill.includes('intermediate')) {
-                level = 3;
-              } else if (lowerSkill.includes('basic') || lowerSkill.includes('beginner')) {
-                level = 2;
-              } else if (lowerSkill.includes('familiar')) {
-                level = 1;
+            for (const [cat, keywords] of SKILL_CATEGORY_KEYWORDS) {
+              if (keywords.some(keyword => lowerSkill.includes(keyword))) {
+                category = cat;
+                break;
               }
+            }
 
-              // Clean the skill name of level indicators
-              const cleanSkillName = skillName
-                .replace(/\s*\(.*?\)\s*/g, '') // Remove parenthetical content
-                .replace(/\s*(expert|advanced|proficient|experienced|intermediate|basic|beginner|familiar)\s*/gi, '')
-                .trim();
-
-              if (cleanSkillName.length > 0) {
-                skills.push({
-                  id: `skill-${Date.now()}-${Math.random()}`,
-                  name: cleanSkillName,
-                  level: level,
-                  category: category,
-                  createdAt: new Date(),
-                  updatedAt: new Date()
-                });
+            // Determine skill level based on context clues
+            let level = 3; // default intermediate level
+
+            // Look for level indicators in the skill name or surrounding context
+            for (const [indicatorLevel, indicators] of SKILL_LEVEL_INDICATORS) {
+              if (indicators.some(indicator => lowerSkill.includes(indicator))) {
+                level = indicatorLevel;
+                break;
               }
             }
-          });
+
+            // Clean the skill name of parenthetical content and level indicators
+            const cleanSkillName = skillName.replace(SKILL_NAME_NOISE_REGEX, '').trim();
+
+            if (cleanSkillName.length > 0) {
+              skills.push({
+                id: this.nextId('skill'),
+                name: cleanSkillName,
+                level: level,
+                category: category,
+                createdAt: new Date(),
+                updatedAt: new Date()
+              });
+            }
+          }
         }
       } catch (error) {
         console.warn(`Error processing skills line ${i}:`, error);
@@ -668,12 +864,16 @@ export class OCRService {
       }
     }
 
-    // Remove duplicates based on skill name (case insensitive)
-    const uniqueSkills = skills.filter((skill, index, self) =>
-      index === self.findIndex(s =>
-        s.name?.toLowerCase() === skill.name?.toLowerCase()
-      )
-    );
+    // Remove duplicates based on skill name (case insensitive), keeping the first
+    const seenNames = new Set<string>();
+    const uniqueSkills = skills.filter(skill => {
+      const key = (skill.name || '').toLowerCase();
+      if (seenNames.has(key)) {
+        return false;
+      }
+      seenNames.add(key);
+      return true;
+    });
 
     return uniqueSkills;
   }
@@ -683,20 +883,17 @@ export class OCRService {
    */
   private extractProjects(lines: string[]): Partial<Project>[] {
     const projects: Partial<Project>[] = [];
-    const projectKeywords = ['projects', 'portfolio', 'work samples'];
 
     let inProjectsSection = false;
     let currentProject: Partial<Project> | null = null;
 
     for (const line of lines) {
-      const lowerLine = line.toLowerCase();
-
-      if (projectKeywords.some(keyword => lowerLine.includes(keyword))) {
+      if (PROJECTS_SECTION_REGEX.test(line)) {
         inProjectsSection = true;
         continue;
       }
 
-      if (inProjectsSection && (lowerLine.includes('experience') || lowerLine.includes('education') || lowerLine.includes('skills'))) {
+      if (inProjectsSection && PROJECTS_SECTION_END_REGEX.test(line)) {
         if (currentProject) {
           projects.push(currentProject);
         }
@@ -730,11 +927,23 @@ export class OCRService {
    * Clean up resources
    */
   async terminate(): Promise<void> {
+    // Let a pending start finish so the worker it creates is torn down too
+    if (this.initPromise) {
+      try {
+        await this.initPromise;
+      } catch {
+        // A failed start leaves nothing to terminate
+      }
+    }
+
     if (this.worker) {
       await this.worker.terminate();
       this.worker = null;
       this.isInitialized = false;
     }
+    this.initPromise = null;
+    this.resultCache.clear();
+    this.cachedSizeCounts.clear();
   }
 }
 
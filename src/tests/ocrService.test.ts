@@ -4,8 +4,22 @@
  * Validates: Requirements 1.1
  */
 
+import { createWorker } from 'tesseract.js';
 import { OCRService } from '../services/ocrService';
 
+jest.mock('tesseract.js', () => ({
+  createWorker: jest.fn()
+}));
+
+type MockWorker = { setParameters: jest.Mock; recognize: jest.Mock; terminate: jest.Mock };
+
+// Stand-in for a Tesseract worker; recognition succeeds unless a test overrides it
+const createMockWorker = (): MockWorker => ({
+  setParameters: jest.fn().mockResolvedValue(undefined),
+  recognize: jest.fn().mockResolvedValue({ data: { text: 'John Doe', confidence: 90 } }),
+  terminate: jest.fn().mockResolvedValue(undefined)
+});
+
 describe('OCR Text Extraction Tests', () => {
   let ocrService: OCRService;
 
@@ -270,5 +284,187 @@ describe('OCR Text Extraction Tests', () => {
       await expect(newService.terminate()).resolves.not.toThrow();
       await expect(newService.terminate()).resolves.not.toThrow();
     });
+
+    test('Property 1m: Error handling - concurrent initialization creates a single worker', async () => {
+      const mockWorker = createMockWorker();
+      (createWorker as jest.Mock).mockResolvedValue(mockWorker);
+      const newService = new OCRService();
+
+      // Property: Overlapping initialize calls should share one worker
+      await Promise.all([newService.initialize(), newService.initialize(), newService.initialize()]);
+      expect(createWorker).toHaveBeenCalledTimes(1);
+      expect(mockWorker.setParameters).toHaveBeenCalledTimes(1);
+
+      // Cleanup
+      await newService.terminate();
+      expect(mockWorker.terminate).toHaveBeenCalledTimes(1);
+    });
+
+    test('Property 1n: Error handling - terminate during initialization tears down the new worker', async () => {
+      const mockWorker = createMockWorker();
+      let finishStart: (worker: MockWorker) => void = () => {};
+      (createWorker as jest.Mock).mockReturnValueOnce(new Promise(resolve => {
+        finishStart = resolve;
+      }));
+      const newService = new OCRService();
+
+      const initializing = newService.initialize();
+      const terminating = newService.terminate();
+      // Let the dynamic import settle so createWorker has been called
+      await new Promise(resolve => setTimeout(resolve, 0));
+      finishStart(mockWorker);
+      await Promise.all([initializing, terminating]);
+
+      // Property: No worker is left running once terminate has resolved
+      expect(mockWorker.terminate).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('Result Cache', () => {
+    const originalCrypto = Object.getOwnPropertyDescriptor(globalThis, 'crypto');
+    let mockWorker: MockWorker;
+    let digest: jest.Mock;
+
+    // jsdom's File has no arrayBuffer(), so attach one backed by the content bytes
+    const createResumeFile = (content: string, type = 'application/pdf'): File => {
+      const file = new File([content], 'resume', { type });
+      const bytes = Uint8Array.from(content, char => char.charCodeAt(0));
+      Object.defineProperty(file, 'arrayBuffer', { value: () => Promise.resolve(bytes.buffer) });
+      return file;
+    };
+
+    beforeEach(() => {
+      mockWorker = createMockWorker();
+      (createWorker as jest.Mock).mockResolvedValue(mockWorker);
+
+      // jsdom has no crypto.subtle; the stub's digest is the content itself
+      digest = jest.fn((_algorithm: string, data: ArrayBuffer) => Promise.resolve(data.slice(0)));
+      Object.defineProperty(globalThis, 'crypto', { value: { subtle: { digest } }, configurable: true });
+    });
+
+    afterEach(() => {
+      if (originalCrypto) {
+        Object.defineProperty(globalThis, 'crypto', originalCrypto);
+      } else {
+        delete (globalThis as { crypto?: Crypto }).crypto;
+      }
+    });
+
+    test('Property 1o: Result cache - identical content skips recognition', async () => {
+      const first = await ocrService.processResume(createResumeFile('resume-a'));
+      const second = await ocrService.processResume(createResumeFile('resume-a'));
+
+      // Property: The second upload of the same bytes is served from the cache
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(1);
+      expect(second).toEqual(first);
+      expect(second.success).toBe(true);
+    });
+
+    test('Property 1p: Result cache - one changed byte is a miss', async () => {
+      await ocrService.processResume(createResumeFile('resume-a'));
+      await ocrService.processResume(createResumeFile('resume-b'));
+
+      // Property: Same size but different content is recognized again
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(2);
+    });
+
+    test('Property 1q: Result cache - failed results are not cached', async () => {
+      // Both PDF strategies fail on the first upload
+      mockWorker.recognize
+        .mockRejectedValueOnce(new Error('Recognition failed'))
+        .mockRejectedValueOnce(new Error('Recognition failed'));
+
+      const failed = await ocrService.processResume(createResumeFile('resume-a'));
+      const retried = await ocrService.processResume(createResumeFile('resume-a'));
+      const cached = await ocrService.processResume(createResumeFile('resume-a'));
+
+      // Property: A failure is retried; only the later success is reused
+      expect(failed.success).toBe(false);
+      expect(retried.success).toBe(true);
+      expect(cached.success).toBe(true);
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(3);
+    });
+
+    test('Property 1r: Result cache - least recently used entry is evicted at the limit', async () => {
+      const cacheLimit = 10;
+      for (let i = 0; i < cacheLimit; i++) {
+        await ocrService.processResume(createResumeFile(`resume-${i}`));
+      }
+
+      // Touch the oldest entry, then overflow the cache by one
+      await ocrService.processResume(createResumeFile('resume-0'));
+      await ocrService.processResume(createResumeFile(`resume-${cacheLimit}`));
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(cacheLimit + 1);
+
+      // Property: The touched entry survives; the next oldest was evicted
+      await ocrService.processResume(createResumeFile('resume-0'));
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(cacheLimit + 1);
+      await ocrService.processResume(createResumeFile('resume-1'));
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(cacheLimit + 2);
+    });
+
+    test('Property 1s: Result cache - terminate clears cached results', async () => {
+      await ocrService.processResume(createResumeFile('resume-a'));
+      await ocrService.terminate();
+      await ocrService.processResume(createResumeFile('resume-a'));
+
+      // Property: Content is recognized again after cleanup
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(2);
+    });
+
+    test('Property 1t: Result cache - caching is bypassed without crypto.subtle', async () => {
+      Object.defineProperty(globalThis, 'crypto', { value: {}, configurable: true });
+
+      const first = await ocrService.processResume(createResumeFile('resume-a'));
+      const second = await ocrService.processResume(createResumeFile('resume-a'));
+
+      // Property: Every upload is recognized and still succeeds
+      expect(first.success).toBe(true);
+      expect(second.success).toBe(true);
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(2);
+    });
+
+    test('Property 1u: Result cache - uploads of an uncached size are not hashed before recognition', async () => {
+      await ocrService.processResume(createResumeFile('resume-a'));
+      expect(digest).toHaveBeenCalledTimes(1);
+
+      let digestsBeforeRecognition = -1;
+      mockWorker.recognize.mockImplementationOnce(() => {
+        digestsBeforeRecognition = digest.mock.calls.length;
+        return Promise.resolve({ data: { text: 'Jane Smith', confidence: 85 } });
+      });
+      await ocrService.processResume(createResumeFile('longer-resume'));
+
+      // Property: A size with no cached entry is only hashed to store its result
+      expect(digestsBeforeRecognition).toBe(1);
+      expect(digest).toHaveBeenCalledTimes(2);
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('Recognition Budget', () => {
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    test('Property 1v: Recognition budget - no fallback is queued once the deadline has passed', async () => {
+      // The first attempt uses up the whole budget before failing
+      let now = 0;
+      jest.spyOn(performance, 'now').mockImplementation(() => now);
+      const mockWorker = createMockWorker();
+      mockWorker.recognize.mockImplementation(() => {
+        now = 60000;
+        return Promise.reject(new Error('Recognition failed'));
+      });
+      (createWorker as jest.Mock).mockResolvedValue(mockWorker);
+
+      const mockFile = new File(['test content'], 'resume.png', { type: 'image/png' });
+      const result = await ocrService.processResume(mockFile);
+
+      // Property: Only the first strategy reaches the worker
+      expect(mockWorker.recognize).toHaveBeenCalledTimes(1);
+      expect(result.success).toBe(false);
+      expect(result.error).toContain('OCR processing timeout');
+    });
   });
 });
\ No newline at end of file
@@ -102,8 +102,8 @@ export const CAREER_GAP_THRESHOLD_DAYS = 90;
 
 // Validation types
 export interface ValidationResult {
-  isValid: boolean;
-  errors: ValidationError[];
+  readonly isValid: boolean;
+  readonly errors: readonly ValidationError[];
 }
 
 export interface ValidationError {
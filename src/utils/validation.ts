@@ -22,6 +22,21 @@ import {
   GapSeverity
 } from '../types';
 
+// Format patterns shared by all validator calls
+const EMAIL_REGEX = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+const PHONE_REGEX = /^[\+]?[1-9][\d]{0,15}$/;
+const PHONE_SEPARATORS_REGEX = /[\s\-\(\)]/g;
+
+// Allowed enum values, resolved once instead of per validated item
+const SKILL_CATEGORY_VALUES: ReadonlySet<string> = new Set(Object.values(SkillCategory));
+const GAP_SEVERITY_VALUES: ReadonlySet<string> = new Set(Object.values(GapSeverity));
+
+// Shared, immutable result returned by every validator that finds no errors
+const SUCCESS_RESULT: ValidationResult = Object.freeze({
+  isValid: true,
+  errors: Object.freeze<ValidationError>([])
+});
+
 /**
  * Creates a validation error
  */
@@ -32,12 +47,9 @@ const createValidationError = (field: string, message: string, code: string): Va
 });
 
 /**
- * Creates a successful validation result
+ * Returns the shared successful validation result
  */
-const createSuccessResult = (): ValidationResult => ({
-  isValid: true,
-  errors: []
-});
+const createSuccessResult = (): ValidationResult => SUCCESS_RESULT;
 
 /**
  * Creates a failed validation result
@@ -51,8 +63,7 @@ const createFailureResult = (errors: ValidationError[]): ValidationResult => ({
  * Validates email format
  */
 const isValidEmail = (email: string): boolean => {
-  const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-  return emailRegex.test(email);
+  return EMAIL_REGEX.test(email);
 };
 
 /**
@@ -71,8 +82,7 @@ const isValidUrl = (url: string): boolean => {
  * Validates phone number format (basic validation)
  */
 const isValidPhone = (phone: string): boolean => {
-  const phoneRegex = /^[\+]?[1-9][\d]{0,15}$/;
-  return phoneRegex.test(phone.replace(/[\s\-\(\)]/g, ''));
+  return PHONE_REGEX.test(phone.replace(PHONE_SEPARATORS_REGEX, ''));
 };
 
 /**
@@ -183,7 +193,7 @@ export const validateSkill: ValidatorFunction<Skill> = (skill) => {
 
   if (!skill.category || skill.category.trim().length === 0) {
     errors.push(createValidationError('category', 'Skill category is required', 'REQUIRED_FIELD'));
-  } else if (!Object.values(SkillCategory).includes(skill.category as SkillCategory)) {
+  } else if (!SKILL_CATEGORY_VALUES.has(skill.category)) {
     errors.push(createValidationError('category', 'Invalid skill category', 'INVALID_VALUE'));
   }
 
@@ -274,7 +284,7 @@ export const validateCareerGap: ValidatorFunction<CareerGap> = (gap) => {
     errors.push(createValidationError('type', 'Gap type must be either "employment" or "education"', 'INVALID_VALUE'));
   }
 
-  if (!gap.severity || !Object.values(GapSeverity).includes(gap.severity as GapSeverity)) {
+  if (!gap.severity || !GAP_SEVERITY_VALUES.has(gap.severity)) {
     errors.push(createValidationError('severity', 'Invalid gap severity', 'INVALID_VALUE'));
   }
 